@@ -7,9 +7,6 @@ from __future__ import absolute_import, division, print_function
 
 import click
 
-from meticulous._github import is_archived
-from meticulous._process import run_invocation
-
 CONTEXT_SETTINGS = dict(help_option_names=["-h", "--help"])
 
 __version__ = "0.1"
@@ -25,7 +22,7 @@ def main(ctxt, target, start):
     Main click group handler
     """
     if ctxt.invoked_subcommand is None:
-        run_invocation(target, start)
+        invoke_process(target, start)
 
 
 @main.command()
@@ -35,7 +32,7 @@ def invoke(target, start):
     """
     Primary command handler
     """
-    run_invocation(target, start)
+    invoke_process(target, start)
 
 
 @main.command()
@@ -43,8 +40,24 @@ def test():
     """
     Test command handler
     """
+    from meticulous._github import (  # pylint: disable=import-outside-toplevel
+        is_archived,
+    )
+
     print(is_archived("kennethreitz/clint"))
 
 
+def invoke_process(target, start):
+    """
+    Import and run the main processing, deferred so --help and --version
+    avoid loading the GitHub, git and web server dependencies
+    """
+    from meticulous._process import (  # pylint: disable=import-outside-toplevel
+        run_invocation,
+    )
+
+    run_invocation(target, start)
+
+
 if __name__ == "__main__":
     main()  # pylint: disable=no-value-for-parameter
@@ -5,6 +5,7 @@ Manager user input and background tasks
 import collections
 import threading
 
+from meticulous._input import UserCancel
 from meticulous._progress import add_progress
 
 Context = collections.namedtuple("Context", ["controller", "taskjson", "interaction"])
@@ -100,7 +101,13 @@ class Controller:
         factory = self._handlers[task["name"]]
         context = Context(controller=self, taskjson=task, interaction=interaction)
         handler = factory(context)
-        return handler()
+        try:
+            return handler()
+        except UserCancel:
+            # Input abandoned, keep the task so it is saved with the workload
+            self._input_queue.add(task)
+            self.quit()
+            return None
 
     def quit(self):
         """
@@ -3,9 +3,10 @@ Main processing for meticulous
 """
 from __future__ import absolute_import, division, print_function
 
+import functools
 import io
+import itertools
 import os
-import pathlib
 import re
 import sys
 from pathlib import Path
@@ -28,6 +29,26 @@ from meticulous._util import get_editor
 # no need to create issues first
 CREATE_ISSUE_FIRST = False
 
+_WORD_RE = re.compile("[a-zA-Z]+")
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_user_login():
+    """
+    Obtain the login of the authenticated user, which does not change during
+    a run so is only requested once
+    """
+    return get_api().get_user().login
+
+
+@functools.lru_cache(maxsize=None)
+def _repopath(repodir):
+    """
+    Obtain the path for a saved repository directory, shared between the
+    several steps of a submission
+    """
+    return Path(repodir)
+
 
 def get_note(kind, pr_url=None):
     """
@@ -40,8 +61,7 @@ def get_note(kind, pr_url=None):
     )
     if kind != "issue" or pr_url is None:
         return header
-    api = get_api()
-    user_org = api.get_user().login
+    user_org = _cached_user_login()
     return f"""\
 {header}
 
@@ -61,12 +81,7 @@ def submit_handlers():
     """
     Obtain multithread task handlers for submission.
     """
-    return {
-        "submit": submit,
-        "issue_and_branch": issue_and_branch,
-        "plain_pr": plain_pr,
-        "full_pr": full_pr,
-    }
+    return _SUBMIT_HANDLERS
 
 
 def submit(context):
@@ -161,6 +176,14 @@ def issue_and_branch(context):
     return handler
 
 
+_SUBMIT_HANDLERS = {
+    "submit": submit,
+    "issue_and_branch": issue_and_branch,
+    "plain_pr": plain_pr,
+    "full_pr": full_pr,
+}
+
+
 def add_cleanup(context, reponame):
     """
     Kick off cleanup on completion
@@ -187,14 +210,23 @@ def check_if_plain_pr(reposave):
     pull request or is happy with just a pull request.
     """
 
-    repopath = Path(reposave["repodir"])
+    repopath = _repopath(reposave["repodir"])
+    github_dir = repopath / ".github"
+    try:
+        with os.scandir(github_dir) as entries:
+            github_names = {entry.name for entry in entries}
+    except OSError:
+        github_names = set()
+    paths = [
+        github_dir / name
+        for name in ("ISSUE_TEMPLATE", "pull_request_template.md")
+        if name in github_names
+    ]
+    paths.append(repopath / "CONTRIBUTING.md")
     suggest_issue = False
-    if display_and_check_files(repopath / ".github" / "ISSUE_TEMPLATE"):
-        suggest_issue = True
-    if display_and_check_files(repopath / ".github" / "pull_request_template.md"):
-        suggest_issue = True
-    if display_and_check_files(repopath / "CONTRIBUTING.md"):
-        suggest_issue = True
+    for path in paths:
+        if display_and_check_files(path):
+            suggest_issue = True
     if not suggest_issue:
         return True
     return False
@@ -229,18 +261,16 @@ def issue_and_branch_for(reponame, repository_saves_multi):
     if any(reposave["repodir"] != check["repodir"] for check in repository_saves_multi):
         raise ValueError("Mismatch in repositories making issue and branch")
     no_issues = Path("__no_issues__.txt")
-    repodir = reposave["repodir"]
-    repodirpath = Path(repodir)
+    repodirpath = _repopath(reposave["repodir"])
     no_issues_path = repodirpath / no_issues
-    if no_issues_path.is_file() or not CREATE_ISSUE_FIRST:
+    if not CREATE_ISSUE_FIRST or no_issues_path.is_file():
         plain_pr_for(reponame, repository_saves_multi)
         return
     make_a_commit_multi(reponame, repository_saves_multi, False)
     _, _, from_branch, to_branch = non_interactive_prepare_commit_multi(
         repository_saves_multi
     )
-    api = get_api()
-    user_org = api.get_user().login
+    user_org = _cached_user_login()
     pr_url = f"https://github.com/{user_org}/{reponame}/pull/new/{from_branch}"
     make_issue_multi(reponame, repository_saves_multi, True, pr_url=pr_url)
     submit_issue_multi(reponame, repository_saves_multi, None)
@@ -253,8 +283,7 @@ def prepare_a_pr_or_issue_for(reponame, reposave):
     """
     try:
         while True:
-            repodir = reposave["repodir"]
-            repodirpath = Path(repodir)
+            repodirpath = _repopath(reposave["repodir"])
             choices = get_pr_or_issue_choices(reponame, repodirpath)
             option = make_choice(choices)
             if option is None:
@@ -313,7 +342,7 @@ def make_issue(
     add_word = reposave["add_word"]
     del_word = reposave["del_word"]
     file_paths = reposave["file_paths"]
-    repodir = Path(reposave["repodir"])
+    repodir = _repopath(reposave["repodir"])
     files = ", ".join(file_paths)
     title = f"Fix simple typo: {del_word} -> {add_word}"
     if is_full:
@@ -340,10 +369,8 @@ Should read `{add_word}` rather than `{del_word}`.
 
 {get_note('issue', pr_url)}
 """
-    with io.open(str(repodir / "__issue__.txt"), "w", encoding="utf-8") as fobj:
-        print(title, file=fobj)
-        print("", file=fobj)
-        print(body, file=fobj)
+    issue_path = repodir / "__issue__.txt"
+    issue_path.write_text(f"{title}\n\n{body}\n", encoding="utf-8")
 
 
 def make_issue_multi(
@@ -360,7 +387,7 @@ def make_issue_multi(
     reposave = reposaves[0]
     if any(reposave["repodir"] != check["repodir"] for check in reposaves):
         raise ValueError("Mismatch in repositories making issue")
-    repodir = Path(reposave["repodir"])
+    repodir = _repopath(reposave["repodir"])
     steps = []
     for item in reposaves:
         files = ", ".join(item["file_paths"])
@@ -383,10 +410,8 @@ def make_issue_multi(
 
 {get_note('issue', pr_url)}
 """
-    with io.open(str(repodir / "__issue__.txt"), "w", encoding="utf-8") as fobj:
-        print(title, file=fobj)
-        print("", file=fobj)
-        print(body, file=fobj)
+    issue_path = repodir / "__issue__.txt"
+    issue_path.write_text(f"{title}\n\n{body}\n", encoding="utf-8")
 
 
 def make_a_commit(reponame, reposave, is_full):  # pylint: disable=unused-argument
@@ -396,20 +421,20 @@ def make_a_commit(reponame, reposave, is_full):  # pylint: disable=unused-argume
     add_word = reposave["add_word"]
     del_word = reposave["del_word"]
     file_paths = reposave["file_paths"]
-    repodir = Path(reposave["repodir"])
+    repodir = _repopath(reposave["repodir"])
     files = ", ".join(file_paths)
-    commit_path = str(repodir / "__commit__.txt")
-    with io.open(commit_path, "w", encoding="utf-8") as fobj:
-        print(
-            f"""\
+    commit_path = repodir / "__commit__.txt"
+    commit_path.write_text(
+        f"""\
 docs: fix simple typo, {del_word} -> {add_word}
 
 There is a small typo in {files}.
 
 Should read `{add_word}` rather than `{del_word}`.
+
 """,
-            file=fobj,
-        )
+        encoding="utf-8",
+    )
 
 
 def make_a_commit_multi(
@@ -426,25 +451,26 @@ def make_a_commit_multi(
     reposave = reposaves[0]
     if any(reposave["repodir"] != check["repodir"] for check in reposaves):
         raise ValueError("Mismatch in makind a commit")
-    repodir = Path(reposave["repodir"])
-    commit_path = str(repodir / "__commit__.txt")
-    with io.open(commit_path, "w", encoding="utf-8") as fobj:
-        print(
-            f"""\
+    repodir = _repopath(reposave["repodir"])
+    commit_path = repodir / "__commit__.txt"
+    commit_path.write_text(
+        f"""\
 docs: Fix a few typos
 
 {summary_multi(reposaves)}
+
 """,
-            file=fobj,
-        )
+        encoding="utf-8",
+    )
 
 
 def summary_multi(reposaves):
     """
     Get a text summary of fixing several typos.
     """
-    file_paths = list(set(sum((reposave["file_paths"] for reposave in reposaves), [])))
-    file_paths.sort()
+    file_paths = sorted(
+        set(itertools.chain.from_iterable(item["file_paths"] for item in reposaves))
+    )
     files = "\n".join([f"- {file_path}" for file_path in file_paths])
     lines = "\n".join(
         [
@@ -466,26 +492,26 @@ def submit_issue(reponame, reposave, ctxt):  # pylint: disable=unused-argument
     """
     Push up an issue
     """
-    repodir = Path(reposave["repodir"])
+    repodir = _repopath(reposave["repodir"])
     add_word = reposave["add_word"]
     del_word = reposave["del_word"]
     file_paths = reposave["file_paths"]
     files = ", ".join(file_paths)
-    issue_path = str(repodir / "__issue__.txt")
+    issue_path = repodir / "__issue__.txt"
     title, body = load_commit_like_file(issue_path)
     issue_num = issue_via_api(reponame, title, body)
-    commit_path = str(repodir / "__commit__.txt")
-    with io.open(commit_path, "w", encoding="utf-8") as fobj:
-        print(
-            f"""\
+    commit_path = repodir / "__commit__.txt"
+    commit_path.write_text(
+        f"""\
 docs: fix simple typo, {del_word} -> {add_word}
 
 There is a small typo in {files}.
 
 Closes #{issue_num}
+
 """,
-            file=fobj,
-        )
+        encoding="utf-8",
+    )
 
 
 def submit_issue_multi(reponame, reposaves, ctxt):  # pylint: disable=unused-argument
@@ -500,22 +526,22 @@ def submit_issue_multi(reponame, reposaves, ctxt):  # pylint: disable=unused-arg
     if len(reposaves) == 1:
         submit_issue(reponame, reposave, ctxt)
         return
-    repodir = Path(reposave["repodir"])
-    issue_path = str(repodir / "__issue__.txt")
+    repodir = _repopath(reposave["repodir"])
+    issue_path = repodir / "__issue__.txt"
     title, body = load_commit_like_file(issue_path)
     issue_num = issue_via_api(reponame, title, body)
-    commit_path = str(repodir / "__commit__.txt")
-    with io.open(commit_path, "w", encoding="utf-8") as fobj:
-        print(
-            f"""\
+    commit_path = repodir / "__commit__.txt"
+    commit_path.write_text(
+        f"""\
 docs: fix a few simple typos
 
 {summary_multi(reposaves)}
 
 Closes #{issue_num}
+
 """,
-            file=fobj,
-        )
+        encoding="utf-8",
+    )
 
 
 def issue_via_api(reponame, title, body):
@@ -575,8 +601,8 @@ def non_interactive_prepare_commit_multi(reposaves):
     reposave = reposaves[0]
     if any(reposave["repodir"] != check["repodir"] for check in reposaves):
         raise ValueError("Mismatch in repositories preparing commit")
-    repodir = Path(reposave["repodir"])
-    commit_path = str(repodir / "__commit__.txt")
+    repodir = _repopath(reposave["repodir"])
+    commit_path = repodir / "__commit__.txt"
     title, body = load_commit_like_file(commit_path)
     if len(reposaves) == 1:
         add_word = reposave["add_word"]
@@ -591,16 +617,29 @@ def push_commit_multi(repodir, branch_name):
     """
     Create commit and push
     """
-    git = local["git"]
-    # plumbum bug workaround
-    os.chdir(pathlib.Path.home())
-    with local.cwd(repodir):
-        to_branch = git("symbolic-ref", "--short", "HEAD").strip()
-        git("commit", "-F", "__commit__.txt")
-        git("push", "origin", f"{to_branch}:{branch_name}")
+    git = local["git"].with_cwd(repodir)
+    to_branch = get_current_branch(repodir)
+    git("commit", "-F", "__commit__.txt")
+    git("push", "origin", f"{to_branch}:{branch_name}")
     return to_branch
 
 
+def get_current_branch(repodir):
+    """
+    Read the checked out branch name from HEAD without spawning git
+    """
+    head_prefix = "ref: refs/heads/"
+    try:
+        head_path = _repopath(str(repodir)) / ".git" / "HEAD"
+        head = head_path.read_text(encoding="utf-8")
+    except OSError:
+        head = ""
+    if head.startswith(head_prefix):
+        return head.strip().replace(head_prefix, "", 1)
+    git = local["git"].with_cwd(repodir)
+    return git("symbolic-ref", "--short", "HEAD").strip()
+
+
 def amend_commit(repository_saves_multi, from_branch, to_branch):
     """
     Update commit message to include issue number
@@ -611,12 +650,9 @@ def amend_commit(repository_saves_multi, from_branch, to_branch):
     if any(reposave["repodir"] != check["repodir"] for check in repository_saves_multi):
         raise ValueError("Mismatch in repositories amending commit")
     repodir = reposave["repodir"]
-    git = local["git"]
-    # plumbum bug workaround
-    os.chdir(pathlib.Path.home())
-    with local.cwd(repodir):
-        git("commit", "-F", "__commit__.txt", "--amend")
-        git("push", "origin", "-f", f"{to_branch}:{from_branch}")
+    git = local["git"].with_cwd(repodir)
+    git("commit", "-F", "__commit__.txt", "--amend")
+    git("push", "origin", "-f", f"{to_branch}:{from_branch}")
 
 
 def show_path(reponame, reposave, path):  # pylint: disable=unused-argument
@@ -625,11 +661,8 @@ def show_path(reponame, reposave, path):  # pylint: disable=unused-argument
     """
     print("Opening editor")
     editor = local[get_editor()]
-    repodir = reposave["repodir"]
-    # plumbum bug workaround
-    os.chdir(pathlib.Path.home())
-    with local.cwd(repodir):
-        _ = editor[str(path)] & FG
+    repodirpath = _repopath(reposave["repodir"])
+    _ = editor.with_cwd(repodirpath)[path] & FG
 
 
 def add_change_for_repo(repodir):
@@ -648,29 +681,30 @@ def get_typo(repodir):
     """
     Look in the staged commit for the typo.
     """
-    git = local["git"]
+    git = local["git"].with_cwd(repodir)
     del_lines = []
     add_lines = []
     file_paths = []
-    # plumbum bug workaround
-    os.chdir(pathlib.Path.home())
-    with local.cwd(repodir):
-        output = git("diff", "--staged")
-        for line in output.splitlines():
-            if line.startswith("--- a/"):
-                index = len("--- a/")
-                file_path = line[index:]
-                file_paths.append(file_path)
-        for line in output.splitlines():
-            if line.startswith("-") and not line.startswith("--- "):
+    with git.popen(
+        ["diff", "--staged"], stderr=None, encoding="utf-8", errors="replace"
+    ) as proc:
+        for rawline in proc.stdout:
+            line = rawline.rstrip("\r\n")
+            if line.startswith("--- "):
+                if line.startswith("--- a/"):
+                    index = len("--- a/")
+                    file_paths.append(line[index:])
+            elif line.startswith("+++ "):
+                continue
+            elif line.startswith("-"):
                 del_lines.append(line[1:])
-            elif line.startswith("+") and not line.startswith("+++ "):
+            elif line.startswith("+"):
                 add_lines.append(line[1:])
-    if not del_lines or not add_lines:
+    if proc.returncode != 0 or not del_lines or not add_lines:
         print("Could not read diff", file=sys.stderr)
         raise ProcessingFailed()
-    del_words = re.findall("[a-zA-Z]+", del_lines[0])
-    add_words = re.findall("[a-zA-Z]+", add_lines[0])
+    del_words = _WORD_RE.findall(del_lines[0])
+    add_words = _WORD_RE.findall(add_lines[0])
     for del_word, add_word in zip(del_words, add_words):
         if del_word != add_word:
             return del_word, add_word, file_paths
@@ -3,20 +3,39 @@ Stores the current input requirement for the web requests to await their arrival
 """
 
 import datetime
+import itertools
 import uuid
-from threading import Condition, Thread
+from queue import SimpleQueue
+from threading import Lock, Thread, local
 
 from ansi2html import Ansi2HTMLConverter
 from flask import request
 
+from meticulous._input import UserCancel
 from meticulous._multiworker import Interaction, multiworker_core
 from meticulous._progress import get_progress
 
 INPUT = 0
 CONFIRMATION = 1
 
+_CONVERTERS = local()
 
-class StateHandler(Interaction):
+# Queued in place of a response to release a waiting worker on stop
+_STOPPED = object()
+
+
+def convert(message):
+    """
+    Convert ANSI text to HTML reusing a converter per thread as the
+    converter stores state while converting
+    """
+    conv = getattr(_CONVERTERS, "conv", None)
+    if conv is None:
+        conv = _CONVERTERS.conv = Ansi2HTMLConverter()
+    return conv.convert(message)
+
+
+class StateHandler(Interaction):  # pylint: disable=too-many-instance-attributes
     """
     Records the state to await user requests
     """
@@ -24,10 +43,11 @@ class StateHandler(Interaction):
     def __init__(self):
         self.alive = False
         self.started_at = datetime.datetime.min
-        self.condition = Condition()
+        self.lock = Lock()
+        self.responses = SimpleQueue()
         self.messages = []
+        self.rendered_messages = []
         self.await_key = None
-        self.response_val = None
         self.thread = None
 
     def response(self):
@@ -38,12 +58,11 @@ class StateHandler(Interaction):
         if self.await_key is not None:
             content = self.await_key.handle(self)
         if content is None:
-            conv = Ansi2HTMLConverter()
-            content = "".join(conv.convert(msg) for msg in self.messages)
+            content = self.render_messages()
             if self.await_key is not None:
                 content += self.await_key.get_html()
             else:
-                progress = "<br />".join(conv.convert(msg) for msg in get_progress())
+                progress = "<br />".join(convert(msg) for msg in get_progress())
                 content += f"""
 No interaction required yet, will reload.<br />
 {progress}
@@ -76,12 +95,25 @@ table {'{'}
 </html>
 """
 
+    def render_messages(self):
+        """
+        Obtain the messages as HTML only converting those added since the
+        last render
+        """
+        with self.lock:
+            rendered = self.rendered_messages
+            new_messages = itertools.islice(self.messages, len(rendered), None)
+            rendered.extend(convert(msg) for msg in new_messages)
+            return "".join(rendered)
+
     def start(self, target):
         """
         Begin processing
         """
         if self.thread is not None:
             self.stop()
+        self.alive = True
+        self.responses = SimpleQueue()
         self.thread = Thread(target=self.run, args=(target,), name="webworker")
         self.thread.start()
 
@@ -90,7 +122,6 @@ table {'{'}
         Perform processing
         """
         self.started_at = datetime.datetime.now()
-        self.alive = True
         while self.alive:
             multiworker_core(self, target)
 
@@ -99,9 +130,12 @@ table {'{'}
         Gracefully stop processing
         """
         self.alive = False
+        self.responses.put(_STOPPED)
         self.thread.join()
         self.thread = None
         self.started_at = datetime.datetime.min
+        with self.lock:
+            del self.rendered_messages[:]
 
     def get_input(self, message):
         return self.get_await(Input(message))
@@ -119,12 +153,13 @@ table {'{'}
         """
         Work out the user response
         """
-        with self.condition:
-            self.response_val = None
-            self.await_key = key
-            while self.response_val is None:
-                self.condition.wait(10)
-        return self.response_val
+        if not self.alive:
+            raise UserCancel()
+        self.await_key = key
+        val = self.responses.get()
+        if val is _STOPPED:
+            raise UserCancel()
+        return val
 
     def send(self, message):
         self.messages.append(message)
@@ -133,11 +168,13 @@ table {'{'}
         """
         A response is chosen
         """
-        with self.condition:
+        with self.lock:
+            if self.await_key is None:
+                return
             self.await_key = None
             del self.messages[:]
-            self.response_val = val
-            self.condition.notify()
+            del self.rendered_messages[:]
+        self.responses.put(val)
 
 
 class Awaiter:
@@ -147,6 +184,7 @@ class Awaiter:
 
     def __init__(self):
         self.uuid = uuid.uuid4()
+        self.html = None
 
     def get_form(self, content):
         """
@@ -179,7 +217,15 @@ setTimeout("location.reload()", 500);
 
     def get_html(self):
         """
-        Obtain the request HTML
+        Obtain the request HTML, rendered once as the request does not change
+        """
+        if self.html is None:
+            self.html = self.render_html()
+        return self.html
+
+    def render_html(self):
+        """
+        Render the request HTML
         """
         raise NotImplementedError()
 
@@ -191,8 +237,7 @@ class Confirmation(Awaiter):
 
     def __init__(self, message, defaultval):
         super().__init__()
-        conv = Ansi2HTMLConverter()
-        self.content = conv.convert(message)
+        self.content = convert(message)
         self.defaultval = defaultval
 
     def get_form_button(self, val):
@@ -218,9 +263,9 @@ class Confirmation(Awaiter):
         state.respond(val == "Yes")
         return self.reload()
 
-    def get_html(self):
+    def render_html(self):
         """
-        Obtain the request HTML
+        Render the request HTML
         """
         formyes = self.get_form_button("Yes")
         formno = self.get_form_button("No")
@@ -247,8 +292,7 @@ class Input(Awaiter):
 
     def __init__(self, message):
         super().__init__()
-        conv = Ansi2HTMLConverter()
-        self.content = conv.convert(message)
+        self.content = convert(message)
 
     def handle(self, state):
         """
@@ -262,9 +306,9 @@ class Input(Awaiter):
         state.respond(val)
         return self.reload()
 
-    def get_html(self):
+    def render_html(self):
         """
-        Obtain the request HTML
+        Render the request HTML
         """
         textinput = f"""
 {self.content}<br/>
@@ -284,8 +328,7 @@ class Choice(Awaiter):
 
     def __init__(self, choices, message):
         super().__init__()
-        conv = Ansi2HTMLConverter()
-        self.content = conv.convert(message)
+        self.content = convert(message)
         options = list(enumerate(sorted(choices.keys())))
         self.choices = {index: choices[txt] for index, txt in options}
         self.options = "\n".join(
@@ -304,9 +347,9 @@ class Choice(Awaiter):
         state.respond(self.choices.get(int(val)))
         return self.reload()
 
-    def get_html(self):
+    def render_html(self):
         """
-        Obtain the request HTML
+        Render the request HTML
         """
         selectform = f"""
 {self.content}<br/>
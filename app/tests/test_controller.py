@@ -5,6 +5,7 @@ Test cases to check the controller
 import threading
 
 from meticulous._controller import Controller
+from meticulous._input import UserCancel
 from meticulous._input_queue import get_input_queue
 from meticulous._multiworker import KeyboardInteraction
 from meticulous._threadpool import get_pool
@@ -93,3 +94,33 @@ def test_user_shutdown():
         result = controller.run(interaction)
     # Verify
     assert result == [nexttask]  # noqa=S101 # nosec
+
+
+def test_cancel_keeps_task():
+    """
+    Given an interactive task whose input is abandoned confirm the controller
+    terminates and saves the task
+    """
+    # Setup
+    def gen_handle(_):
+        def handle():
+            raise UserCancel()
+
+        return handle
+
+    input_queue = get_input_queue()
+    handlers = {"1": gen_handle}
+    threadpool = get_pool(handlers)
+    controller = Controller(
+        handlers=handlers, input_queue=input_queue, threadpool=threadpool
+    )
+    task = {"interactive": True, "priority": 1, "name": "1"}
+    nexttask = {"interactive": True, "priority": 2, "name": "1"}
+    with controller:
+        controller.add(task)
+        controller.add(nexttask)
+        interaction = KeyboardInteraction()
+        # Exercise
+        result = controller.run(interaction)
+    # Verify
+    assert result == [task, nexttask]  # noqa=S101 # nosec
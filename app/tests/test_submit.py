@@ -0,0 +1,182 @@
+"""
+Test submission calls
+"""
+
+import os
+import pathlib
+import shutil
+import tempfile
+from unittest import mock
+
+from plumbum import local
+
+from meticulous import _submit
+
+
+def test_check_if_plain_pr_displays_each_call():
+    """
+    Ensure repository templates are shown every time the user is asked
+    """
+    # Setup
+    tmpdir = pathlib.Path(tempfile.mkdtemp())
+    (tmpdir / ".github" / "ISSUE_TEMPLATE").mkdir(parents=True)
+    (tmpdir / ".github" / "pull_request_template.md").write_text("Expect\n")
+    reposave = {"repodir": str(tmpdir)}
+    # Exercise
+    with mock.patch(
+        "meticulous._submit.display_and_check_files", return_value=True
+    ) as check_mock:
+        first = _submit.check_if_plain_pr(reposave)
+        second = _submit.check_if_plain_pr(reposave)
+    # Verify
+    assert first is False  # noqa # nosec
+    assert second is False  # noqa # nosec
+    assert check_mock.call_count == 6  # noqa # nosec
+    shutil.rmtree(tmpdir)
+
+
+def test_check_if_plain_pr_without_templates():
+    """
+    Ensure only the contributing guide is checked without a .github directory
+    """
+    # Setup
+    tmpdir = tempfile.mkdtemp()
+    reposave = {"repodir": tmpdir}
+    # Exercise
+    with mock.patch(
+        "meticulous._submit.display_and_check_files", return_value=False
+    ) as check_mock:
+        result = _submit.check_if_plain_pr(reposave)
+    # Verify
+    assert result is True  # noqa # nosec
+    check_mock.assert_called_once_with(pathlib.Path(tmpdir) / "CONTRIBUTING.md")
+    shutil.rmtree(tmpdir)
+
+
+def test_get_typo():
+    """
+    Ensure the typo is read from the staged diff of a repository
+    """
+    # Setup
+    tmpdir = pathlib.Path(tempfile.mkdtemp())
+    git = local["git"].with_cwd(tmpdir)
+    git("init", "-q")
+    (tmpdir / "README.md").write_text("Intro\nSee thier docs.\n")
+    git("add", "README.md")
+    git(
+        "-c",
+        "user.name=test",
+        "-c",
+        "user.email=test@example.com",
+        "commit",
+        "-qm",
+        "init",
+    )
+    (tmpdir / "README.md").write_text("Intro\nSee their docs.\n")
+    git("add", "README.md")
+    # Exercise
+    result = _submit.get_typo(tmpdir)
+    # Verify
+    assert result == ("thier", "their", ["README.md"])  # noqa # nosec
+    shutil.rmtree(tmpdir)
+
+
+def test_get_typo_removed_cwd():
+    """
+    Ensure the typo is read even if the process directory was removed by the
+    cleanup of another repository
+    """
+    # Setup
+    tmpdir = pathlib.Path(tempfile.mkdtemp())
+    git = local["git"].with_cwd(tmpdir)
+    git("init", "-q")
+    (tmpdir / "README.md").write_text("See thier docs.\n")
+    git("add", "README.md")
+    git(
+        "-c",
+        "user.name=test",
+        "-c",
+        "user.email=test@example.com",
+        "commit",
+        "-qm",
+        "init",
+    )
+    (tmpdir / "README.md").write_text("See their docs.\n")
+    git("add", "README.md")
+    origdir = os.getcwd()
+    removed = tempfile.mkdtemp()
+    os.chdir(removed)
+    os.rmdir(removed)
+    try:
+        # Exercise
+        result = _submit.get_typo(tmpdir)
+    finally:
+        os.chdir(origdir)
+    # Verify
+    assert result == ("thier", "their", ["README.md"])  # noqa # nosec
+    shutil.rmtree(tmpdir)
+
+
+def test_get_current_branch():
+    """
+    Ensure the checked out branch is read from the repository
+    """
+    # Setup
+    tmpdir = pathlib.Path(tempfile.mkdtemp())
+    git = local["git"].with_cwd(tmpdir)
+    git("init", "-q")
+    git("checkout", "-q", "-b", "feature/typos")
+    # Exercise
+    result = _submit.get_current_branch(tmpdir)
+    # Verify
+    assert result == "feature/typos"  # noqa # nosec
+    shutil.rmtree(tmpdir)
+
+
+def test_summary_multi():
+    """
+    Ensure files are listed once in order along with each fix
+    """
+    # Setup
+    reposaves = [
+        {"add_word": "their", "del_word": "thier", "file_paths": ["b.md", "a.md"]},
+        {"add_word": "which", "del_word": "whcih", "file_paths": ["a.md"]},
+    ]
+    # Exercise
+    result = _submit.summary_multi(reposaves)
+    # Verify
+    assert result == (  # noqa # nosec
+        "There are small typos in:\n"
+        "- a.md\n"
+        "- b.md\n"
+        "\n"
+        "Fixes:\n"
+        "- Should read `their` rather than `thier`.\n"
+        "- Should read `which` rather than `whcih`.\n"
+    )
+
+
+def test_make_a_commit():
+    """
+    Ensure the commit template can be read back as a title and body
+    """
+    # Setup
+    tmpdir = pathlib.Path(tempfile.mkdtemp())
+    reposave = {
+        "add_word": "their",
+        "del_word": "thier",
+        "file_paths": ["README.md"],
+        "repodir": str(tmpdir),
+    }
+    # Exercise
+    _submit.make_a_commit("repo", reposave, False)
+    # Verify
+    title, body = _submit.load_commit_like_file(tmpdir / "__commit__.txt")
+    assert title == "docs: fix simple typo, thier -> their"  # noqa # nosec
+    assert body == (  # noqa # nosec
+        "There is a small typo in README.md.\n"
+        "\n"
+        "Should read `their` rather than `thier`.\n"
+        "\n"
+    )
+    shutil.rmtree(tmpdir)
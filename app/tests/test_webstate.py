@@ -0,0 +1,112 @@
+"""
+Test web interaction state
+"""
+
+import threading
+import time
+from unittest import mock
+
+from pytest import raises
+
+from meticulous._input import UserCancel
+from meticulous._webstate import Confirmation, StateHandler
+
+
+@mock.patch("meticulous._webstate.convert")
+def test_render_messages_incremental(convert_mock):
+    """
+    Ensure messages are only converted once across renders
+    """
+    # Setup
+    convert_mock.side_effect = str.upper
+    state = StateHandler()
+    state.send("first")
+    state.render_messages()
+    state.send("second")
+    # Exercise
+    result = state.render_messages()
+    # Verify
+    assert result == "FIRSTSECOND"  # noqa # nosec
+    assert convert_mock.call_count == 2  # noqa # nosec
+
+
+@mock.patch("meticulous._webstate.convert")
+def test_render_messages_cleared_on_respond(convert_mock):
+    """
+    Ensure a response discards the rendered messages
+    """
+    # Setup
+    convert_mock.side_effect = str.upper
+    state = StateHandler()
+    state.await_key = "key"
+    state.send("first")
+    state.render_messages()
+    # Exercise
+    state.respond(True)
+    # Verify
+    assert state.render_messages() == ""  # noqa # nosec
+
+
+def test_get_await_woken_by_respond():
+    """
+    Ensure a waiting request returns as soon as a response arrives
+    """
+    # Setup
+    state = StateHandler()
+    state.alive = True
+    results = []
+    waiter = threading.Thread(target=lambda: results.append(state.get_await("key")))
+    waiter.start()
+    while state.await_key is None:
+        time.sleep(0.01)
+    # Exercise
+    state.respond("value")
+    waiter.join(5)
+    # Verify
+    assert results == ["value"]  # noqa # nosec
+
+
+def test_respond_without_request_ignored():
+    """
+    Ensure a repeated submission does not answer the next request
+    """
+    # Setup
+    state = StateHandler()
+    state.alive = True
+    state.await_key = "key"
+    state.respond("first")
+    # Exercise
+    state.respond("second")
+    # Verify
+    assert state.get_await("next") == "first"  # noqa # nosec
+    assert state.responses.empty()  # noqa # nosec
+
+
+def test_get_await_stopped():
+    """
+    Ensure waiting for a response is abandoned once processing stops
+    """
+    # Setup
+    state = StateHandler()
+    state.alive = False
+    # Exercise / Verify
+    with raises(UserCancel):
+        state.get_await("key")
+
+
+def test_confirmation_html_rendered_once():
+    """
+    Ensure the request HTML is only rendered once
+    """
+    # Setup
+    confirmation = Confirmation("Continue?", True)
+    # Exercise
+    with mock.patch.object(
+        confirmation, "render_html", wraps=confirmation.render_html
+    ) as render_mock:
+        first = confirmation.get_html()
+        second = confirmation.get_html()
+    # Verify
+    assert first is second  # noqa # nosec
+    assert str(confirmation.uuid) in first  # noqa # nosec
+    assert render_mock.call_count == 1  # noqa # nosec